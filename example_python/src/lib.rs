@@ -1,12 +1,16 @@
 //! Python bindings for the bakery_model3 tables over SurrealDB.
 //!
 //! Exposes one Python class per entity (Bakery, Client, Order, Product), each
-//! supporting `count()` and `list_all()`. Tables are wrapped via `Vista` so
-//! the binding is decoupled from the SurrealDB backend type.
+//! supporting `count()`, `list_all()` and the paged `iter_all()` async
+//! iterator. Tables are wrapped via `Vista` so the binding is decoupled from
+//! the SurrealDB backend type.
 
 use bakery_model3::{Bakery, Client, Order, Product, connect_surrealdb, surrealdb};
-use pyo3::exceptions::{PyConnectionError, PyRuntimeError};
+use pyo3::exceptions::{PyConnectionError, PyRuntimeError, PyStopAsyncIteration};
 use pyo3::prelude::*;
+use std::collections::VecDeque;
+use std::sync::Arc;
+use tokio::sync::{Mutex, OnceCell};
 use vantage_dataset::prelude::ReadableValueSet;
 use vantage_vista::Vista;
 
@@ -46,26 +50,108 @@ async fn count_vista(vista: Vista) -> PyResult<i64> {
     vista.get_count().await.map_err(to_py_err)
 }
 
+fn record_to_json<V: serde::Serialize>(
+    id: String,
+    record: impl IntoIterator<Item = (String, V)>,
+) -> String {
+    let mut obj = serde_json::Map::new();
+    obj.insert("id".to_string(), serde_json::Value::String(id));
+    let mut data = serde_json::Map::new();
+    for (k, v) in record {
+        data.insert(
+            k,
+            serde_json::to_value(&v).unwrap_or(serde_json::Value::Null),
+        );
+    }
+    obj.insert("data".to_string(), serde_json::Value::Object(data));
+    serde_json::Value::Object(obj).to_string()
+}
+
 async fn list_vista(vista: Vista) -> PyResult<Vec<String>> {
     let records = vista.list_values().await.map_err(to_py_err)?;
     Ok(records
         .into_iter()
-        .map(|(id, record)| {
-            let mut obj = serde_json::Map::new();
-            obj.insert("id".to_string(), serde_json::Value::String(id));
-            let mut data = serde_json::Map::new();
-            for (k, v) in record {
-                data.insert(k, serde_json::to_value(&v).unwrap_or(serde_json::Value::Null));
+        .map(|(id, record)| record_to_json(id, record))
+        .collect())
+}
+
+struct RecordStreamState {
+    factory: fn() -> Vista,
+    vista: Option<Vista>,
+    batch: usize,
+    next_page: usize,
+    buffer: VecDeque<String>,
+    exhausted: bool,
+}
+
+/// Async iterator over a table's records, fetched one page at a time so only
+/// a single batch is resident. Returned by `iter_all()`.
+///
+/// The `Vista` is built on the first `__anext__`, inside the async body like
+/// `count()` and `list_all()`, so an uninitialized database fails the await
+/// rather than the `iter_all()` call.
+///
+/// Frozen: the mutable cursor lives behind the `Mutex`, so Python-side calls
+/// skip PyO3's per-call borrow-flag checks.
+#[pyclass(frozen)]
+pub struct PyRecordStream {
+    state: Arc<Mutex<RecordStreamState>>,
+}
+
+impl PyRecordStream {
+    fn new(factory: fn() -> Vista, batch: usize) -> Self {
+        Self {
+            state: Arc::new(Mutex::new(RecordStreamState {
+                factory,
+                vista: None,
+                batch: batch.max(1),
+                next_page: 1,
+                buffer: VecDeque::new(),
+                exhausted: false,
+            })),
+        }
+    }
+}
+
+#[pymethods]
+impl PyRecordStream {
+    fn __aiter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __anext__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let state = self.state.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let mut guard = state.lock().await;
+            let state = &mut *guard;
+            if state.buffer.is_empty() && !state.exhausted {
+                if state.vista.is_none() {
+                    let mut vista = (state.factory)();
+                    vista.set_page_size(state.batch).map_err(to_py_err)?;
+                    state.vista = Some(vista);
+                }
+                let vista = state.vista.as_ref().expect("vista is built above");
+                let page = vista.fetch_page(state.next_page).await.map_err(to_py_err)?;
+                state.next_page += 1;
+                state.exhausted = page.len() < state.batch;
+                state.buffer.extend(
+                    page.into_iter()
+                        .map(|(id, record)| record_to_json(id, record)),
+                );
             }
-            obj.insert("data".to_string(), serde_json::Value::Object(data));
-            serde_json::Value::Object(obj).to_string()
+            state
+                .buffer
+                .pop_front()
+                .ok_or_else(|| PyStopAsyncIteration::new_err(()))
         })
-        .collect())
+    }
 }
 
 macro_rules! py_table_class {
     ($Name:ident, $factory:ident) => {
-        #[pyclass]
+        // Stateless handles: frozen lets every `&self` method skip the
+        // runtime borrow check.
+        #[pyclass(frozen)]
         pub struct $Name;
 
         #[pymethods]
@@ -86,6 +172,11 @@ macro_rules! py_table_class {
                     list_vista($factory()).await
                 })
             }
+
+            #[pyo3(signature = (batch = 1000))]
+            fn iter_all(&self, batch: usize) -> PyRecordStream {
+                PyRecordStream::new($factory, batch)
+            }
         }
     };
 }
@@ -95,12 +186,20 @@ py_table_class!(PyBakery, vista_bakery);
 py_table_class!(PyOrder, vista_order);
 py_table_class!(PyProduct, vista_product);
 
+static DB_INIT: OnceCell<()> = OnceCell::const_new();
+
+/// Connect to SurrealDB. Safe to call repeatedly: the first successful call
+/// establishes the process-wide connection and later calls reuse it.
 #[pyfunction]
 fn init_database(py: Python<'_>) -> PyResult<Bound<'_, PyAny>> {
     pyo3_async_runtimes::tokio::future_into_py(py, async {
-        connect_surrealdb()
-            .await
-            .map_err(|e| PyConnectionError::new_err(e.to_string()))?;
+        DB_INIT
+            .get_or_try_init(|| async {
+                connect_surrealdb()
+                    .await
+                    .map_err(|e| PyConnectionError::new_err(e.to_string()))
+            })
+            .await?;
         Ok(())
     })
 }
@@ -111,6 +210,7 @@ fn example_python(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyBakery>()?;
     m.add_class::<PyOrder>()?;
     m.add_class::<PyProduct>()?;
+    m.add_class::<PyRecordStream>()?;
     m.add_function(wrap_pyfunction!(init_database, m)?)?;
     Ok(())
 }
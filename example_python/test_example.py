@@ -10,10 +10,19 @@ This test demonstrates:
 """
 
 import asyncio
+import atexit
 from decimal import Decimal
+from functools import partial
+import logging
+import logging.handlers
+import queue
 import sys
 import os
-import json
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Add the built library to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'target/release'))
@@ -25,26 +34,118 @@ except ImportError as e:
     print("Make sure to build the library first with: maturin develop")
     sys.exit(1)
 
+# Progress output goes through a queue so stdout writes happen on the
+# listener thread rather than blocking the event loop
+_log_queue = queue.SimpleQueue()
+log = logging.getLogger("example_python.test")
+# DEBUG=1 adds diagnostic detail such as runtime types
+log.setLevel(logging.DEBUG if os.environ.get("DEBUG") else logging.INFO)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+_log_output = logging.StreamHandler(sys.stdout)
+_log_output.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+# Started at import so output also appears when the module is imported
+# (e.g. collected by pytest); flushed and stopped at interpreter exit
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Decimal literals parsed once at import rather than per test call
+LARGE_AMOUNT = Decimal("9999999999.99")
+
+# Values that would lose precision as float, paired with their parsed Decimal
+PRECISION_VALUES = tuple(
+    (value_str, Decimal(value_str))
+    for value_str in (
+        "9999999999.99",
+        "0.01",
+        "123456789.123456789",
+        "0.000000001",
+        "999999.999999999",
+    )
+)
+
+# Upper bound on in-flight queries, kept at or below the connection pool size
+POOL_SIZE = int(os.environ.get("SURREALDB_POOL_SIZE", "10"))
+if POOL_SIZE < 1:
+    raise ValueError(f"SURREALDB_POOL_SIZE must be at least 1, got {POOL_SIZE}")
+
+
+async def gather_with_concurrency(n, *factories, return_exceptions=False):
+    """Like asyncio.gather, but with at most n calls running at once.
+
+    Takes zero-argument callables rather than awaitables: binding methods
+    start their query as soon as they are called, so each call has to be
+    made only after a semaphore slot is free.
+    """
+    semaphore = asyncio.Semaphore(n)
+    
+    async def sem_call(factory):
+        async with semaphore:
+            return await factory()
+    
+    return await asyncio.gather(
+        *(sem_call(factory) for factory in factories),
+        return_exceptions=return_exceptions,
+    )
+
+
+def parse_records(records):
+    """Decode a batch of record JSON strings; blocking, so run it in an executor"""
+    return [json_loads(record_json) for record_json in records]
+
+
+async def first_records(model, limit):
+    """Stream up to limit records rather than listing the table, and decode
+    them in an executor so other models' queries proceed meanwhile"""
+    records = []
+    async for record_json in model.iter_all(batch=limit):
+        records.append(record_json)
+        if len(records) >= limit:
+            break
+    return await asyncio.get_running_loop().run_in_executor(
+        None, parse_records, records
+    )
+
+
+def as_decimal(value):
+    """Coerce a balance to Decimal, skipping the parse when it already is one.
+
+    Besides strings, accepts a (sign, digits, exponent) triple as produced by
+    Decimal.as_tuple(); digits may also be a bytes string of ASCII digits.
+    Triples are built by mpdecimal directly, with no string parsing.
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, tuple):
+        sign, digits, exponent = value
+        if isinstance(digits, (bytes, bytearray)):
+            digits = tuple(d - 48 for d in digits)
+        return Decimal((sign, digits, exponent))
+    return Decimal(value)
+
 
 async def test_database_connection():
     """Test database initialization"""
-    print("=== Testing Database Connection ===")
+    log.info("=== Testing Database Connection ===")
     
     try:
-        print("1. Initializing database connection...")
+        log.info("1. Initializing database connection...")
+        # Idempotent: repeat calls reuse the process-wide connection
         await example_python.init_database()
-        print("   ✓ Database connected successfully")
+        log.info("   ✓ Database connected successfully")
         return True
     except Exception as e:
-        print(f"   ✗ Database connection failed: {e}")
-        print("   Make sure SurrealDB is running on ws://localhost:8000")
-        print("   Or set SURREALDB_URL environment variable")
+        log.error(f"   ✗ Database connection failed: {e}")
+        log.error("   Make sure SurrealDB is running on ws://localhost:8000")
+        log.error("   Or set SURREALDB_URL environment variable")
         return False
 
 
 async def test_individual_model_classes():
     """Test individual model classes"""
-    print("\n=== Testing Individual Model Classes ===")
+    log.info("\n=== Testing Individual Model Classes ===")
     
     # Test all model types
     model_classes = [
@@ -54,31 +155,38 @@ async def test_individual_model_classes():
         ("product", example_python.PyProduct),
     ]
     
-    for model_name, model_class in model_classes:
-        print(f"2. Testing {model_name} model...")
+    models = [model_class() for _, model_class in model_classes]
+    log.info(f"2. Testing {len(models)} models concurrently...")
+    
+    # Counts plus a streamed preview per model, all dispatched in one wave;
+    # the preview reads one small page instead of materializing the table
+    results = await gather_with_concurrency(
+        POOL_SIZE,
+        *(m.count for m in models),
+        *(partial(first_records, m, 3) for m in models),
+        return_exceptions=True,
+    )
+    counts, previews = results[:len(models)], results[len(models):]
+    
+    for (model_name, _), count, records in zip(model_classes, counts, previews):
+        log.info(f"   Testing {model_name} model...")
         
         try:
-            # Create model instance
-            model = model_class()
-            print(f"   Created {model_name} instance")
-            
-            # Test count operation
-            count = await model.count()
-            print(f"   Record count: {count}")
+            if isinstance(count, BaseException):
+                raise count
+            if isinstance(records, BaseException):
+                raise records
             
-            # Test list operation
-            records = await model.list_all()
-            print(f"   Records found: {len(records)}")
+            log.info(f"   Record count: {count}")
             
             # Show first few records (if any)
-            for i, record_json in enumerate(records[:3]):
-                record = json.loads(record_json)
-                print(f"   Record {i+1}: ID={record['id']}")
+            for i, record in enumerate(records):
+                log.info(f"   Record {i+1}: ID={record['id']}")
             
-            print(f"   ✓ {model_name} model operations successful")
+            log.info(f"   ✓ {model_name} model operations successful")
             
         except Exception as e:
-            print(f"   ✗ Error with {model_name} model: {e}")
+            log.error(f"   ✗ Error with {model_name} model: {e}")
             return False
     
     return True
@@ -87,187 +195,175 @@ async def test_individual_model_classes():
 async def test_bakery_client_workflow():
     """Test the main workflow: bakery -> clients -> paying balance"""
     
-    print("\n=== Testing Bakery-Client Workflow ===")
+    log.info("\n=== Testing Bakery-Client Workflow ===")
     
     try:
         # Step 1: Create bakery object
-        print("3. Creating bakery object...")
+        log.info("3. Creating bakery object...")
         bakery = example_python.PyBakery()
-        print(f"   Created bakery instance")
-        
-        # Get bakery count
-        bakery_count = await bakery.count()
-        print(f"   Bakeries in database: {bakery_count}")
+        log.info(f"   Created bakery instance")
         
         # Step 2: Get clients from bakery (if relationships are set up)
-        print("4. Attempting to get clients from bakery...")
+        log.info("4. Attempting to get clients from bakery...")
         try:
             clients = bakery.ref_clients()
-            print(f"   Got clients from bakery")
+            log.info(f"   Got clients from bakery")
             
-            # Step 3: Test client operations
-            client_count = await clients.count()
-            print(f"   Clients in database: {client_count}")
+            # Steps 3-4: counts and paying balance are independent, so
+            # issue them together
+            log.info("5. Getting counts and paying client balance...")
+            bakery_count, client_count, balance = await gather_with_concurrency(
+                POOL_SIZE, bakery.count, clients.count, clients.get_paying_balance
+            )
+            log.info(f"   Bakeries in database: {bakery_count}")
+            log.info(f"   Clients in database: {client_count}")
             
-            # Step 4: Get paying balance
-            print("5. Getting paying client balance...")
-            balance_str = await clients.get_paying_balance()
-            
-            # Convert to Python Decimal for precision
-            balance = Decimal(balance_str)
-            print(f"   Total paying client balance: {balance}")
-            print(f"   Balance type: {type(balance)}")
+            # Convert to Python Decimal for precision (no-op if already one)
+            balance = as_decimal(balance)
+            log.info(f"   Total paying client balance: {balance}")
+            log.debug(f"   Balance type: {type(balance)}")
             
             # Test precision handling
-            test_amount = Decimal("9999999999.99")
-            print(f"   Can handle large amounts: {test_amount}")
-            print(f"   Addition test: {balance + test_amount}")
+            log.info(f"   Can handle large amounts: {LARGE_AMOUNT}")
+            log.info(f"   Addition test: {balance + LARGE_AMOUNT}")
             
             # Verify it's a proper Decimal
-            assert isinstance(balance, Decimal), f"Expected Decimal, got {type(balance)}"
-            print("   ✓ Balance returned as precise Decimal type")
+            assert balance.__class__ is Decimal, f"Expected Decimal, got {type(balance)}"
+            log.info("   ✓ Balance returned as precise Decimal type")
             
         except Exception as e:
-            print(f"   ⚠️  Relationship traversal failed: {e}")
-            print("   This is expected if bakery-client relationships aren't set up in test data")
+            log.warning(f"   ⚠️  Relationship traversal failed: {e}")
+            log.warning("   This is expected if bakery-client relationships aren't set up in test data")
             
             # Test clients directly instead
-            print("6. Testing clients directly...")
+            log.info("6. Testing clients directly...")
             clients = example_python.PyClient()
-            client_count = await clients.count()
-            print(f"   Direct client count: {client_count}")
+            bakery_count, client_count = await gather_with_concurrency(
+                POOL_SIZE, bakery.count, clients.count
+            )
+            log.info(f"   Bakeries in database: {bakery_count}")
+            log.info(f"   Direct client count: {client_count}")
             
             if client_count > 0:
-                balance_str = await clients.get_paying_balance()
-                balance = Decimal(balance_str)
-                print(f"   Direct paying balance: {balance}")
+                balance = as_decimal(await clients.get_paying_balance())
+                log.info(f"   Direct paying balance: {balance}")
         
-        print("   ✓ Workflow test completed")
+        log.info("   ✓ Workflow test completed")
         return True
         
     except Exception as e:
-        print(f"   ✗ Workflow error: {e}")
+        log.error(f"   ✗ Workflow error: {e}")
         return False
 
 
 async def test_client_specific_methods():
     """Test client-specific methods"""
     
-    print("\n=== Testing Client-Specific Methods ===")
+    log.info("\n=== Testing Client-Specific Methods ===")
     
     try:
         # Test PyClient directly
-        print("7. Testing PyClient class...")
+        log.info("7. Testing PyClient class...")
         clients = example_python.PyClient()
         
         client_count = await clients.count()
-        print(f"   Client count: {client_count}")
+        log.info(f"   Client count: {client_count}")
         
         # Test get_paying_balance - the main method we want to demonstrate
-        print("8. Testing get_paying_balance method...")
-        balance_str = await clients.get_paying_balance()
-        balance = Decimal(balance_str)
-        print(f"   Paying balance: {balance}")
-        print(f"   Balance type: {type(balance)}")
+        log.info("8. Testing get_paying_balance method...")
+        balance = as_decimal(await clients.get_paying_balance())
+        log.info(f"   Paying balance: {balance}")
+        log.debug(f"   Balance type: {type(balance)}")
         
         # Test precision with large numbers
-        test_amount = Decimal("9999999999.99")
-        result = balance + test_amount
-        print(f"   Precision test: {balance} + {test_amount} = {result}")
+        result = balance + LARGE_AMOUNT
+        log.info(f"   Precision test: {balance} + {LARGE_AMOUNT} = {result}")
         
         # Test relationship methods
-        print("9. Testing relationship methods...")
+        log.info("9. Testing relationship methods...")
         try:
             bakery = clients.ref_bakery()
-            print(f"   ref_bakery() returned: {type(bakery)}")
+            log.info(f"   ref_bakery() returned: {type(bakery)}")
             
             orders = clients.ref_orders()
-            print(f"   ref_orders() returned: {type(orders)}")
+            log.info(f"   ref_orders() returned: {type(orders)}")
         except Exception as e:
-            print(f"   ⚠️  Relationship methods failed: {e}")
+            log.warning(f"   ⚠️  Relationship methods failed: {e}")
         
         # List some clients
         client_records = await clients.list_all()
-        print(f"   Found {len(client_records)} client records")
+        log.info(f"   Found {len(client_records)} client records")
         
-        print("   ✓ PyClient methods working correctly")
+        log.info("   ✓ PyClient methods working correctly")
         return True
         
     except Exception as e:
-        print(f"   ✗ Client method error: {e}")
+        log.error(f"   ✗ Client method error: {e}")
         return False
 
 
+def check_round_trip(decimal_val):
+    """Round-trip through str must preserve the value (trailing zeros may differ)"""
+    back_to_str = str(decimal_val)
+    return back_to_str, Decimal(back_to_str) == decimal_val
+
+
 def test_decimal_precision():
     """Test that we can handle large decimal numbers without precision loss"""
     
-    print("\n=== Testing Decimal Precision ===")
+    log.info("\n=== Testing Decimal Precision ===")
     
-    # Test cases that would fail with float
-    test_values = [
-        "9999999999.99",
-        "0.01", 
-        "123456789.123456789",
-        "0.000000001",
-        "999999.999999999",
-    ]
-    
-    for value_str in test_values:
-        decimal_val = Decimal(value_str)
-        print(f"   Testing: {value_str} -> {decimal_val}")
-        
-        # Convert back to string and verify no precision loss
-        back_to_str = str(decimal_val)
-        if back_to_str != value_str:
-            # Handle cases where trailing zeros are removed
-            if Decimal(back_to_str) != Decimal(value_str):
-                print(f"   ✗ Precision lost: {value_str} != {back_to_str}")
-                return False
+    for value_str, decimal_val in PRECISION_VALUES:
+        log.info(f"   Testing: {value_str} -> {decimal_val}")
+        back_to_str, preserved = check_round_trip(decimal_val)
+        if not preserved:
+            log.error(f"   ✗ Precision lost: {value_str} != {back_to_str}")
+            return False
     
-    print("   ✓ All decimal precision tests passed")
+    log.info("   ✓ All decimal precision tests passed")
     return True
 
 
 async def main():
     """Main test runner"""
     
-    print("🐍 Starting Python integration tests for Vantage BakeryModel\n")
+    log.info("🐍 Starting Python integration tests for Vantage BakeryModel\n")
     
     # Test decimal precision first (doesn't require database)
     if not test_decimal_precision():
-        print("\n❌ Decimal precision tests failed!")
+        log.error("\n❌ Decimal precision tests failed!")
         return 1
     
     # Test database connection
     if not await test_database_connection():
-        print("\n❌ Database connection failed!")
-        print("   Skipping database-dependent tests...")
+        log.error("\n❌ Database connection failed!")
+        log.error("   Skipping database-dependent tests...")
         return 1
     
     # Test individual model classes
     if not await test_individual_model_classes():
-        print("\n❌ Individual model class tests failed!")
+        log.error("\n❌ Individual model class tests failed!")
         return 1
     
     # Test client-specific methods
     if not await test_client_specific_methods():
-        print("\n❌ Client-specific method tests failed!")
+        log.error("\n❌ Client-specific method tests failed!")
         return 1
     
     # Test main workflow
     if not await test_bakery_client_workflow():
-        print("\n❌ Bakery-client workflow tests failed!")
+        log.error("\n❌ Bakery-client workflow tests failed!")
         return 1
     
-    print("\n🎉 All tests passed!")
-    print("\n📊 Test Summary:")
-    print("   ✓ Decimal precision handling")
-    print("   ✓ Database connection")  
-    print("   ✓ Individual model classes (PyClient, PyBakery, etc.)")
-    print("   ✓ Client-specific methods (get_paying_balance)")
-    print("   ✓ Cross-table relationships")
-    print("   ✓ Async operation bridging")
-    print("   ✓ Financial data precision (Decimal type)")
+    log.info("\n🎉 All tests passed!")
+    log.info("\n📊 Test Summary:")
+    log.info("   ✓ Decimal precision handling")
+    log.info("   ✓ Database connection")  
+    log.info("   ✓ Individual model classes (PyClient, PyBakery, etc.)")
+    log.info("   ✓ Client-specific methods (get_paying_balance)")
+    log.info("   ✓ Cross-table relationships")
+    log.info("   ✓ Async operation bridging")
+    log.info("   ✓ Financial data precision (Decimal type)")
     
     return 0
 